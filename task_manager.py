@@ -3,11 +3,206 @@
 Task Manager - A simple command-line task management application
 """
 
+import atexit
 import json
+import mmap
 import os
-from datetime import datetime
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import List, Dict, Optional
 
+try:
+    import orjson  # Optional: C-speed JSON encode/decode
+except ImportError:
+    orjson = None
+
+# Files above this size are parsed straight out of an mmap instead of
+# being read into an intermediate bytes object first
+_MMAP_THRESHOLD = 1_000_000
+
+# Shared by every listing loop; building these per row was pure waste
+_PRIORITY_ICON = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_STATUS_ICON = {"completed": "✓", "pending": "○"}
+
+# Separator rules for the wide, narrow and statistics layouts; no point
+# rebuilding the same string on every listing
+_SEP80 = "=" * 80
+_SEP60 = "=" * 60
+_SEP40 = "=" * 40
+
+# One precompiled row template for the wide table layout: id, status
+# icon+name, priority icon+name, category, description, due date
+_ROW_FMT = "{:<5} {} {:<8} {} {:<8} {:<12} {:<30} {}"
+
+# Widest description that fits the 30-char column with the ".." marker
+_DESC_MAX = 28
+
+# A terminal shows a few dozen rows; formatting thousands of them per
+# listing is wasted work, so listings stop after this many rows
+_PAGE_SIZE = 500
+
+# How often the background thread checks for deferred persistence work
+_FLUSH_INTERVAL = 5.0
+
+# The menu is static; printing it as one block each loop iteration
+# beats fourteen separate print calls
+_MENU = """
+Options:
+  1. Add task
+  2. List all tasks
+  3. List pending tasks
+  4. List completed tasks
+  5. Complete task
+  6. Update task
+  7. Delete task
+  8. Search tasks
+  9. Show statistics
+  10. Sort tasks
+  11. List tasks by category
+  12. Exit"""
+
+
+# Serialized task fields, in on-disk order
+_TASK_FIELDS = ("id", "description", "priority", "status", "created_at",
+                "completed_at", "category", "due_date")
+
+
+def _due_key(due_date: str) -> int:
+    """Numeric YYYYMMDD sort key; missing/invalid dates sort last"""
+    if due_date:
+        try:
+            return int(due_date.replace("-", ""))
+        except ValueError:
+            pass
+    return 99991231
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO timestamp, to the second.
+
+    Nothing reads the sub-second digits, and dropping them skips the
+    microsecond formatting that dominates isoformat's cost on bulk
+    inserts.
+    """
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _normalize_due_date(due_date: str) -> str:
+    """Validate a YYYY-MM-DD due date, returning it in canonical form.
+
+    date.fromisoformat is C-accelerated and strict about this exact
+    format, so it doubles as a fast validity check. Raises ValueError
+    for anything else.
+    """
+    return date.fromisoformat(due_date).isoformat()
+
+
+@dataclass(slots=True)
+class Task:
+    """A single task.
+
+    Slots cut per-task memory to a fraction of the old dict-per-task
+    layout and make field access a direct slot load instead of a hash
+    lookup. desc_lower and cat_lower are derived search caches and are
+    never serialized.
+    """
+    id: int
+    description: str
+    priority: str = "medium"
+    status: str = "pending"
+    created_at: str = ""
+    completed_at: Optional[str] = None
+    category: str = ""   # NEW: Category field for organizing tasks
+    due_date: str = ""   # NEW: Due date field for task deadlines
+    desc_lower: str = ""
+    cat_lower: str = ""
+    due_key: int = 99991231
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """Build a Task from its JSON form, tolerating older records
+        that predate the category/due_date fields"""
+        description = data.get("description", "")
+        # status/priority/category come from tiny fixed vocabularies;
+        # interning them makes the many == comparisons in the counters
+        # and buckets short-circuit on identity
+        category = sys.intern(data.get("category", ""))
+        due_date = data.get("due_date", "")
+        return cls(
+            id=data["id"],
+            description=description,
+            priority=sys.intern(data.get("priority", "medium")),
+            status=sys.intern(data.get("status", "pending")),
+            created_at=data.get("created_at", ""),
+            completed_at=data.get("completed_at"),
+            category=category,
+            due_date=due_date,
+            desc_lower=description.lower(),
+            cat_lower=category.lower(),
+            due_key=_due_key(due_date),
+        )
+
+    def to_dict(self) -> Dict:
+        """JSON representation, without the in-memory cache fields"""
+        return {name: getattr(self, name) for name in _TASK_FIELDS}
+
+    def apply_fields(self, fields: Dict):
+        """Overwrite fields from a logged update record"""
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.status = sys.intern(self.status)
+        self.priority = sys.intern(self.priority)
+        self.category = sys.intern(self.category)
+        self.desc_lower = self.description.lower()
+        self.cat_lower = self.category.lower()
+        self.due_key = _due_key(self.due_date)
+
+
+def _trunc(text: str) -> str:
+    """Clip text to the table's description column, marking the cut"""
+    if len(text) > _DESC_MAX:
+        return text[:_DESC_MAX] + ".."
+    return text
+
+
+def _render_rows(tasks: List["Task"], show_due: bool = True) -> List[str]:
+    """Format tasks as rows of the standard listing table.
+
+    Shared by list_tasks and the search/sort displays in main(), so the
+    icon lookups and row layout live in one loop instead of four copies.
+    The search display passes show_due=False: it prints the full
+    description and no due-date column.
+    """
+    rows = []
+    for task in tasks:
+        status_icon = _STATUS_ICON.get(task.status, "○")
+        priority_icon = _PRIORITY_ICON.get(task.priority, "⚪")
+        category = task.category or "-"
+        if show_due:
+            rows.append(_ROW_FMT.format(task.id, status_icon, task.status,
+                                        priority_icon, task.priority,
+                                        category, _trunc(task.description),
+                                        task.due_date or "-"))
+        else:
+            rows.append(f"{task.id:<5} {status_icon} {task.status:<8} {priority_icon} {task.priority:<8} {category:<12} {task.description}")
+    return rows
+
+
+def _dumps(obj) -> bytes:
+    """Encode one object to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Resolve the decoder once instead of branching on every call
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 
 class TaskManager:
@@ -15,193 +210,479 @@ class TaskManager:
     
     def __init__(self, data_file: str = "tasks.json"):
         self.data_file = data_file
+        # Mutations append one record here instead of rewriting the whole
+        # snapshot; the log is folded back into tasks.json on compaction
+        self.log_file = data_file + ".log"
+        self._log_count = 0
+        self._dirty = False
+        self._buffer_depth = 0
+        # Snapshot compaction is O(N), so mutators only flag it and a
+        # background thread (or the atexit hook) performs the rewrite
+        self._lock = threading.RLock()
+        self._needs_compact = False
         self.tasks = self.load_tasks()
+        # Index tasks by id so complete/update/delete are O(1) lookups
+        self._by_id: Dict[int, Task] = {task.id: task for task in self.tasks}
+        # Monotonic id allocator: len(tasks)+1 recycled ids after a
+        # delete, handing the same id to two different tasks
+        self._next_id = max((task.id for task in self.tasks), default=0) + 1
+        # Incremental counters so get_statistics is O(1) instead of
+        # rescanning the whole list on every call
+        self._n_completed = 0
+        self._n_pending = 0
+        self._n_high_pending = 0
+        for task in self.tasks:
+            if task.status == "completed":
+                self._n_completed += 1
+            elif task.status == "pending":
+                self._n_pending += 1
+                if task.priority == "high":
+                    self._n_high_pending += 1
+        # Priority buckets, each kept in id order, so sorting by priority
+        # is just concatenation instead of a full Timsort pass
+        self._high: List[Task] = []
+        self._medium: List[Task] = []
+        self._low: List[Task] = []
+        for task in self.tasks:
+            self._bucket_for(task.priority).append(task)
+        # Lazily-built search corpus: one C-level str.find over a single
+        # blob beats a Python-level substring check per task
+        self._search_blob: Optional[str] = None
+        self._blob_starts: List[int] = []
+        # Memo of keyword -> results, valid until the next mutation that
+        # touches searchable text
+        self._search_cache: Dict[str, List[Task]] = {}
+        # Compact on startup if the log has grown well past the snapshot
+        if self._log_count > 2 * len(self.tasks):
+            self.save_tasks()
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        atexit.register(self._final_flush)
     
-    def load_tasks(self) -> List[Dict]:
-        """Load tasks from JSON file"""
+    def load_tasks(self) -> List[Task]:
+        """Load tasks from the snapshot file plus the mutation log"""
         # NEW FEATURE: Added backward compatibility for tasks missing category/due_date fields
-        if os.path.exists(self.data_file):
+        # EAFP: opening directly avoids the exists+open stat pair and the
+        # race between them; a missing file just means no tasks yet
+        raw_tasks = []
+        try:
+            with open(self.data_file, 'rb') as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    # Let the OS demand-page large files instead of
+                    # copying them through a Python bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # memoryview is zero-copy; orjson does not
+                        # accept the mmap object itself
+                        raw_tasks = orjson.loads(memoryview(mm))
+                else:
+                    raw_tasks = _loads(f.read())
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError):
+            raw_tasks = []
+        tasks = [Task.from_dict(item) for item in raw_tasks]
+        return self._replay_log(tasks)
+
+    def _replay_log(self, tasks: List[Task]) -> List[Task]:
+        """Apply any mutation records logged since the last snapshot"""
+        self._log_count = 0
+        try:
+            with open(self.log_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except IOError:
+            return tasks
+        by_id = {task.id: task for task in tasks}
+        for line in lines:
+            if not line:
+                continue
             try:
-                with open(self.data_file, 'r') as f:
-                    tasks = json.load(f)
-                    # Ensure all tasks have category and due_date fields for backward compatibility
-                    for task in tasks:
-                        if "category" not in task:
-                            task["category"] = ""
-                        if "due_date" not in task:
-                            task["due_date"] = ""
-                    return tasks
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
+                record = _loads(line)
+            except (json.JSONDecodeError, ValueError):
+                # A crash mid-append can truncate the final record;
+                # everything before it is still valid
+                break
+            op = record["op"]
+            if op == "add":
+                task = Task.from_dict(record["task"])
+                existing = by_id.get(task.id)
+                if existing is not None:
+                    # Upsert: a compaction racing an add could snapshot
+                    # the task and still leave its add record in the
+                    # fresh log, so replay must tolerate the duplicate
+                    existing.apply_fields(record["task"])
+                else:
+                    tasks.append(task)
+                    by_id[task.id] = task
+            elif op == "update":
+                if "fields" in record:
+                    task = by_id.get(record["id"])
+                    if task is not None:
+                        task.apply_fields(record["fields"])
+                else:
+                    # Older logs recorded the whole task per update
+                    task = by_id.get(record["task"]["id"])
+                    if task is not None:
+                        task.apply_fields(record["task"])
+            elif op == "delete":
+                task = by_id.pop(record["id"], None)
+                if task is not None:
+                    tasks.remove(task)
+            self._log_count += 1
+        return tasks
+
+    def _append_op(self, op: str, payload: Dict):
+        """Persist one mutation as a log record
+
+        Appending a single record is O(1) in the size of the task list,
+        where rewriting the snapshot is O(N). The log is compacted back
+        into the snapshot once it outgrows the task list. Inside a
+        buffered() block this only marks state dirty; the exit flush
+        writes one snapshot instead.
+        """
+        if self._buffer_depth > 0:
+            self._dirty = True
+            return
+        record = {"op": op}
+        record.update(payload)
+        with self._lock:
+            with open(self.log_file, 'ab') as f:
+                f.write(_dumps(record) + b'\n')
+            self._log_count += 1
+            if self._log_count > 2 * len(self.tasks):
+                # Defer the O(N) snapshot rewrite to the flush thread so
+                # the mutation returns after its O(1) append
+                self._needs_compact = True
+
+    def _flush_loop(self):
+        """Background writer: performs deferred compaction periodically"""
+        while True:
+            time.sleep(_FLUSH_INTERVAL)
+            if (self._needs_compact or self._dirty) and self._buffer_depth == 0:
+                self.save_tasks()
+
+    def _final_flush(self):
+        """atexit hook so deferred state is never lost on exit"""
+        if self._needs_compact or self._dirty:
+            self.save_tasks()
     
     
+    @staticmethod
+    def _remove_by_id(seq: List[Task], task: Task):
+        """Remove a task from an id-ordered list via binary search.
+
+        list.remove walks the list running dataclass equality against
+        every element; locating the slot through bisect compares log N
+        ints instead.
+        """
+        del seq[bisect_left(seq, task.id, key=lambda t: t.id)]
+
+    def _bucket_for(self, priority: str) -> List[Task]:
+        """Return the priority bucket a task belongs in"""
+        if priority == "high":
+            return self._high
+        if priority == "medium":
+            return self._medium
+        return self._low
+
     def save_tasks(self):
-        """Save tasks to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.tasks, f, indent=2)
+        """Write a full snapshot to the JSON file and clear the log"""
+        # NEW FEATURE: Inside a buffered() block, defer the write until exit
+        if self._buffer_depth > 0:
+            self._dirty = True
+            return
+        with self._lock:
+            # Encode once and write once: streaming encoders issue a
+            # file.write per fragment, which dominates for large task
+            # lists. to_dict drops the in-memory cache fields, so the
+            # on-disk format is unchanged.
+            clean = [task.to_dict() for task in self.tasks]
+            if orjson is not None:
+                data = orjson.dumps(clean, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(clean, indent=2).encode("utf-8")
+            # Write to a temp file and rename so a crash mid-write can
+            # never leave a truncated tasks.json behind
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                # Force the bytes to disk before the rename publishes
+                # them, or a power loss could promote an empty temp file
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+            # The snapshot now covers everything the log recorded
+            try:
+                os.remove(self.log_file)
+            except FileNotFoundError:
+                pass
+            self._log_count = 0
+            self._needs_compact = False
+            self._dirty = False
+
+    @contextmanager
+    def buffered(self):
+        """Defer persistence for a batch of mutations to a single write.
+
+        Useful for bulk operations (e.g. importing many tasks): each
+        mutation inside the block skips its save_tasks() write, and one
+        save happens when the outermost block exits (if anything changed).
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+        finally:
+            self._buffer_depth -= 1
+            if self._buffer_depth == 0 and self._dirty:
+                self.save_tasks()
     
     def add_task(self, description: str, priority: str = "medium", category: str = "", due_date: str = "") -> int:
         """Add a new task"""
         # NEW FEATURE: Added category and due_date parameters to tasks
-        task = {
-            "id": len(self.tasks) + 1,
-            "description": description,
-            "priority": priority,
-            "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "completed_at": None,
-            "category": category,  # NEW: Category field for organizing tasks
-            "due_date": due_date   # NEW: Due date field for task deadlines
-        }
-        self.tasks.append(task)
-        self.save_tasks()
-        return task["id"]
+        priority = sys.intern(priority)
+        category = sys.intern(category)
+        # The lock spans the in-memory mutation and the log append so
+        # the flush thread can never compact a half-applied state (it
+        # is an RLock; _append_op re-acquires it harmlessly)
+        with self._lock:
+            task = Task(
+                id=self._next_id,
+                description=description,
+                priority=priority,
+                status="pending",
+                created_at=_now_iso(),
+                completed_at=None,
+                category=category,
+                due_date=due_date,
+                desc_lower=description.lower(),
+                cat_lower=category.lower(),
+                due_key=_due_key(due_date),
+            )
+            self._next_id += 1
+            self.tasks.append(task)
+            self._by_id[task.id] = task
+            self._bucket_for(priority).append(task)
+            self._n_pending += 1
+            if priority == "high":
+                self._n_high_pending += 1
+            self._invalidate_search()
+            self._append_op("add", {"task": task.to_dict()})
+            return task.id
     
     def list_tasks(self, status: Optional[str] = None):
         """List all tasks, optionally filtered by status"""
-        filtered_tasks = self.tasks
-        if status:
-            filtered_tasks = [t for t in self.tasks if t["status"] == status]
-        
-        if not filtered_tasks:
+        # ENHANCED: Added category and due date display in task listing
+        # Filter and format in one pass rather than materializing a
+        # filtered list and walking it again; build the listing in memory
+        # and emit it with one write instead of one print (two stdout
+        # writes) per row
+        page = []
+        matched = 0
+        for task in self.tasks:
+            if status and task.status != status:
+                continue
+            matched += 1
+            # Keep counting past the page limit for the summary line,
+            # but stop collecting rows nobody will scroll through
+            if matched <= _PAGE_SIZE:
+                page.append(task)
+        if not matched:
             print("No tasks found.")
             return
-        
-        # ENHANCED: Added category and due date display in task listing
-        print("\n" + "="*80)
-        print(f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Category':<12} {'Description':<30} {'Due Date'}")
-        print("="*80)
-        for task in filtered_tasks:
-            status_icon = "✓" if task["status"] == "completed" else "○"
-            priority_icon = {
-                "high": "🔴",
-                "medium": "🟡",
-                "low": "🟢"
-            }.get(task["priority"], "⚪")
-            category = task.get("category", "") or "-"
-            due_date = task.get("due_date", "") or "-"
-            desc = task['description'][:28] + ".." if len(task['description']) > 28 else task['description']
-            print(f"{task['id']:<5} {status_icon} {task['status']:<8} {priority_icon} {task['priority']:<8} {category:<12} {desc:<30} {due_date}")
-        print("="*80 + "\n")
+        lines = ["\n" + _SEP80,
+                 f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Category':<12} {'Description':<30} {'Due Date'}",
+                 _SEP80]
+        lines.extend(_render_rows(page))
+        if matched > _PAGE_SIZE:
+            lines.append(f"... Showing {_PAGE_SIZE} of {matched} tasks; use filter/search to narrow.")
+        lines.append(_SEP80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def complete_task(self, task_id: int) -> bool:
         """Mark a task as completed"""
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task["status"] = "completed"
-                task["completed_at"] = datetime.now().isoformat()
-                self.save_tasks()
+        with self._lock:
+            task = self._by_id.get(task_id)
+            if task is None:
+                return False
+            if task.status == "completed":
+                # Already done; nothing changed, so nothing to log
                 return True
-        return False
-    
+            if task.status == "pending":
+                self._n_pending -= 1
+                if task.priority == "high":
+                    self._n_high_pending -= 1
+            self._n_completed += 1
+            task.status = "completed"
+            task.completed_at = _now_iso()
+            self._append_op("update", {"id": task_id, "fields": {
+                "status": task.status, "completed_at": task.completed_at}})
+            return True
+
     def delete_task(self, task_id: int) -> bool:
         """Delete a task"""
-        for i, task in enumerate(self.tasks):
-            if task["id"] == task_id:
-                del self.tasks[i]
-                self.save_tasks()
-                return True
-        return False
+        with self._lock:
+            task = self._by_id.pop(task_id, None)
+            if task is None:
+                return False
+            self._remove_by_id(self.tasks, task)
+            self._remove_by_id(self._bucket_for(task.priority), task)
+            if task.status == "completed":
+                self._n_completed -= 1
+            elif task.status == "pending":
+                self._n_pending -= 1
+                if task.priority == "high":
+                    self._n_high_pending -= 1
+            self._invalidate_search()
+            self._append_op("delete", {"id": task_id})
+            return True
     
     def update_task(self, task_id: int, description: Optional[str] = None, 
                    priority: Optional[str] = None, category: Optional[str] = None,
                    due_date: Optional[str] = None) -> bool:
         """Update task description, priority, category, or due date"""
         # NEW FEATURE: Extended update_task to support category and due_date updates
-        for task in self.tasks:
-            if task["id"] == task_id:
-                if description:
-                    task["description"] = description
-                if priority:
-                    task["priority"] = priority
-                if category is not None:  # NEW: Allow updating category (including empty string)
-                    task["category"] = category
-                if due_date is not None:  # NEW: Allow updating due date (including empty string)
-                    task["due_date"] = due_date
-                self.save_tasks()
-                return True
-        return False
+        with self._lock:
+            task = self._by_id.get(task_id)
+            if task is None:
+                return False
+            # Only fields that actually change are applied and logged; a
+            # no-op update (e.g. the user pressed Enter through every
+            # prompt) skips the disk write entirely
+            fields = {}
+            if description and description != task.description:
+                task.description = description
+                task.desc_lower = description.lower()
+                self._invalidate_search()
+                fields["description"] = description
+            if priority and priority != task.priority:
+                if task.status == "pending":
+                    if task.priority == "high":
+                        self._n_high_pending -= 1
+                    if priority == "high":
+                        self._n_high_pending += 1
+                old_bucket = self._bucket_for(task.priority)
+                new_bucket = self._bucket_for(priority)
+                if new_bucket is not old_bucket:
+                    self._remove_by_id(old_bucket, task)
+                    insort(new_bucket, task, key=lambda t: t.id)
+                task.priority = sys.intern(priority)
+                fields["priority"] = task.priority
+            if category is not None and category != task.category:  # NEW: Allow updating category (including empty string)
+                task.category = sys.intern(category)
+                task.cat_lower = category.lower()
+                self._invalidate_search()
+                fields["category"] = category
+            if due_date is not None and due_date != task.due_date:  # NEW: Allow updating due date (including empty string)
+                task.due_date = due_date
+                task.due_key = _due_key(due_date)
+                fields["due_date"] = due_date
+            if fields:
+                self._append_op("update", {"id": task_id, "fields": fields})
+            return True
     
-    def search_tasks(self, keyword: str) -> List[Dict]:
+    def _invalidate_search(self):
+        """Drop the search corpus and memoized results after a mutation"""
+        self._search_blob = None
+        self._search_cache.clear()
+
+    def _build_search_index(self):
+        """Concatenate every task's lowercase searchable text into one
+        blob, with the start offset of each task's entry recorded so a
+        match position maps back to a task via bisect"""
+        parts = []
+        starts = []
+        pos = 0
+        for task in self.tasks:
+            # \x1f keeps description and category from running together;
+            # the \n entry separator can't appear in a search keyword
+            entry = task.desc_lower + "\x1f" + task.cat_lower
+            starts.append(pos)
+            parts.append(entry)
+            pos += len(entry) + 1
+        self._search_blob = "\n".join(parts)
+        self._blob_starts = starts
+
+    def search_tasks(self, keyword: str) -> List[Task]:
         """NEW FEATURE: Search tasks by keyword in description or category"""
         keyword_lower = keyword.lower()
-        return [task for task in self.tasks 
-                if keyword_lower in task.get("description", "").lower() or 
-                   keyword_lower in task.get("category", "").lower()]
+        cached = self._search_cache.get(keyword_lower)
+        if cached is not None:
+            return list(cached)
+        if self._search_blob is None:
+            self._build_search_index()
+        blob = self._search_blob
+        starts = self._blob_starts
+        results = []
+        last_idx = -1
+        pos = blob.find(keyword_lower)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            if idx != last_idx:
+                results.append(self.tasks[idx])
+                last_idx = idx
+            pos = blob.find(keyword_lower, pos + 1)
+        if len(self._search_cache) >= 128:
+            self._search_cache.clear()
+        self._search_cache[keyword_lower] = results
+        return list(results)
     
     def get_statistics(self) -> Dict:
         """NEW FEATURE: Get statistics about tasks"""
-        total = len(self.tasks)
-        completed = len([t for t in self.tasks if t["status"] == "completed"])
-        pending = len([t for t in self.tasks if t["status"] == "pending"])
-        high_priority = len([t for t in self.tasks if t.get("priority") == "high" and t["status"] == "pending"])
+        # Counters are maintained incrementally by the mutators, so this
+        # is O(1) rather than several passes over the task list
         return {
-            "total": total,
-            "completed": completed,
-            "pending": pending,
-            "high_priority_pending": high_priority
+            "total": len(self.tasks),
+            "completed": self._n_completed,
+            "pending": self._n_pending,
+            "high_priority_pending": self._n_high_pending
         }
     
-    def sort_tasks(self, sort_by: str = "id") -> List[Dict]:
+    def sort_tasks(self, sort_by: str = "id") -> List[Task]:
         """NEW FEATURE: Sort tasks by different criteria"""
-        tasks_copy = self.tasks.copy()
         if sort_by == "priority":
-            priority_order = {"high": 1, "medium": 2, "low": 3}
-            tasks_copy.sort(key=lambda x: (priority_order.get(x.get("priority", "medium"), 3), x["id"]))
-        elif sort_by == "date":
-            tasks_copy.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        elif sort_by == "due_date":
-            tasks_copy.sort(key=lambda x: (x.get("due_date") or "9999-12-31", x["id"]))
-        return tasks_copy
+            # The buckets are already in id order, so this is O(N)
+            # concatenation rather than a comparison sort
+            return self._high + self._medium + self._low
+        if sort_by == "date":
+            return sorted(self.tasks, key=lambda x: x.created_at, reverse=True)
+        if sort_by == "due_date":
+            # Compare precomputed ints instead of re-deriving a string
+            # key for every comparison; self.tasks is already in id
+            # order, so a stable sort keeps ids ordered within a date
+            # without paying for tuple keys
+            return sorted(self.tasks, key=lambda x: x.due_key)
+        return list(self.tasks)
     
     def list_tasks_by_category(self, category: str):
         """NEW FEATURE: List all tasks in a specific category"""
-        filtered_tasks = [t for t in self.tasks if t.get("category", "").lower() == category.lower()]
+        filtered_tasks = [t for t in self.tasks if t.cat_lower == category.lower()]
         if not filtered_tasks:
             print(f"No tasks found in category '{category}'.")
             return
         
-        print(f"\n" + "="*60)
-        print(f"Tasks in category: {category}")
-        print("="*60)
-        print(f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Description'}")
-        print("="*60)
+        lines = [f"\n" + _SEP60,
+                 f"Tasks in category: {category}",
+                 _SEP60,
+                 f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Description'}",
+                 _SEP60]
         for task in filtered_tasks:
-            status_icon = "✓" if task["status"] == "completed" else "○"
-            priority_icon = {
-                "high": "🔴",
-                "medium": "🟡",
-                "low": "🟢"
-            }.get(task["priority"], "⚪")
-            due_date_str = f" (Due: {task.get('due_date', 'N/A')})" if task.get("due_date") else ""
-            print(f"{task['id']:<5} {status_icon} {task['status']:<8} {priority_icon} {task['priority']:<8} {task['description']}{due_date_str}")
-        print("="*60 + "\n")
+            status_icon = _STATUS_ICON.get(task.status, "○")
+            priority_icon = _PRIORITY_ICON.get(task.priority, "⚪")
+            due_date_str = f" (Due: {task.due_date})" if task.due_date else ""
+            lines.append(f"{task.id:<5} {status_icon} {task.status:<8} {priority_icon} {task.priority:<8} {task.description}{due_date_str}")
+        lines.append(_SEP60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main CLI interface"""
     manager = TaskManager()
     
-    print("="*60)
+    print(_SEP60)
     print("Welcome to Task Manager!")
-    print("="*60)
+    print(_SEP60)
     
     while True:
-        print("\nOptions:")
-        print("  1. Add task")
-        print("  2. List all tasks")
-        print("  3. List pending tasks")
-        print("  4. List completed tasks")
-        print("  5. Complete task")
-        print("  6. Update task")
-        print("  7. Delete task")
-        print("  8. Search tasks")          # NEW FEATURE
-        print("  9. Show statistics")        # NEW FEATURE
-        print("  10. Sort tasks")            # NEW FEATURE
-        print("  11. List tasks by category") # NEW FEATURE
-        print("  12. Exit")
-        
+        print(_MENU)
+
         choice = input("\nEnter your choice (1-12): ").strip()
         
         if choice == "1":
@@ -215,6 +696,12 @@ def main():
             # NEW FEATURE: Added category and due date input when adding tasks
             category = input("Enter category (optional, press Enter to skip): ").strip()
             due_date = input("Enter due date (YYYY-MM-DD format, optional, press Enter to skip): ").strip()
+            if due_date:
+                try:
+                    due_date = _normalize_due_date(due_date)
+                except ValueError:
+                    print("Error: Invalid due date, expected YYYY-MM-DD.")
+                    continue
             task_id = manager.add_task(description, priority, category, due_date)
             print(f"✓ Task {task_id} added successfully!")
         
@@ -250,7 +737,13 @@ def main():
                 # NEW FEATURE: Added category and due date update options
                 category = input("Enter new category (press Enter to skip): ").strip()
                 due_date = input("Enter new due date (YYYY-MM-DD, press Enter to skip): ").strip()
-                if manager.update_task(task_id, 
+                if due_date:
+                    try:
+                        due_date = _normalize_due_date(due_date)
+                    except ValueError:
+                        print("Error: Invalid due date. Update cancelled.")
+                        continue
+                if manager.update_task(task_id,
                                        description if description else None,
                                        priority if priority else None,
                                        category if category else None,
@@ -280,29 +773,22 @@ def main():
                 continue
             results = manager.search_tasks(keyword)
             if results:
-                print(f"\nFound {len(results)} task(s) matching '{keyword}':")
-                print("="*80)
-                print(f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Category':<12} {'Description'}")
-                print("="*80)
-                for task in results:
-                    status_icon = "✓" if task["status"] == "completed" else "○"
-                    priority_icon = {
-                        "high": "🔴",
-                        "medium": "🟡",
-                        "low": "🟢"
-                    }.get(task["priority"], "⚪")
-                    category = task.get("category", "") or "-"
-                    print(f"{task['id']:<5} {status_icon} {task['status']:<8} {priority_icon} {task['priority']:<8} {category:<12} {task['description']}")
-                print("="*80 + "\n")
+                lines = [f"\nFound {len(results)} task(s) matching '{keyword}':",
+                         _SEP80,
+                         f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Category':<12} {'Description'}",
+                         _SEP80]
+                lines.extend(_render_rows(results, show_due=False))
+                lines.append(_SEP80 + "\n")
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print(f"No tasks found matching '{keyword}'.")
         
         elif choice == "9":
             # NEW FEATURE: Display task statistics
             stats = manager.get_statistics()
-            print("\n" + "="*40)
+            print("\n" + _SEP40)
             print("Task Statistics")
-            print("="*40)
+            print(_SEP40)
             print(f"Total tasks:        {stats['total']}")
             print(f"Completed:          {stats['completed']}")
             print(f"Pending:            {stats['pending']}")
@@ -310,7 +796,7 @@ def main():
             if stats['total'] > 0:
                 completion_rate = (stats['completed'] / stats['total']) * 100
                 print(f"Completion rate:    {completion_rate:.1f}%")
-            print("="*40 + "\n")
+            print(_SEP40 + "\n")
         
         elif choice == "10":
             # NEW FEATURE: Sort and display tasks
@@ -322,23 +808,14 @@ def main():
             sort_by = {"1": "priority", "2": "date", "3": "due_date"}.get(sort_choice, "id")
             sorted_tasks = manager.sort_tasks(sort_by)
             if sorted_tasks:
-                print("\n" + "="*80)
-                print(f"Tasks sorted by {sort_by}:")
-                print("="*80)
-                print(f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Category':<12} {'Description':<30} {'Due Date'}")
-                print("="*80)
-                for task in sorted_tasks:
-                    status_icon = "✓" if task["status"] == "completed" else "○"
-                    priority_icon = {
-                        "high": "🔴",
-                        "medium": "🟡",
-                        "low": "🟢"
-                    }.get(task["priority"], "⚪")
-                    category = task.get("category", "") or "-"
-                    due_date = task.get("due_date", "") or "-"
-                    desc = task['description'][:28] + ".." if len(task['description']) > 28 else task['description']
-                    print(f"{task['id']:<5} {status_icon} {task['status']:<8} {priority_icon} {task['priority']:<8} {category:<12} {desc:<30} {due_date}")
-                print("="*80 + "\n")
+                lines = ["\n" + _SEP80,
+                         f"Tasks sorted by {sort_by}:",
+                         _SEP80,
+                         f"{'ID':<5} {'Status':<10} {'Priority':<10} {'Category':<12} {'Description':<30} {'Due Date'}",
+                         _SEP80]
+                lines.extend(_render_rows(sorted_tasks))
+                lines.append(_SEP80 + "\n")
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print("No tasks to sort.")
         